@@ -1,9 +1,29 @@
 """Klisk — A framework for building AI agents programmatically."""
 
-from klisk.core.primitives import define_agent, tool, get_tools
-from klisk.core.registry import AgentRegistry
-from klisk.core.config import ProjectConfig
-from klisk.core.builtin_tools import WebSearch, CodeInterpreter, FileSearch, ImageGeneration
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from klisk.core.builtin_tools import CodeInterpreter, FileSearch, ImageGeneration, WebSearch
+    from klisk.core.config import ProjectConfig
+    from klisk.core.primitives import define_agent, get_tools, tool
+    from klisk.core.registry import AgentRegistry
+
+# The public API is resolved on first access, so importing a submodule such as
+# klisk.cli does not load the Agents SDK.
+_EXPORTS = {
+    "define_agent": "klisk.core.primitives",
+    "tool": "klisk.core.primitives",
+    "get_tools": "klisk.core.primitives",
+    "AgentRegistry": "klisk.core.registry",
+    "ProjectConfig": "klisk.core.config",
+    "WebSearch": "klisk.core.builtin_tools",
+    "CodeInterpreter": "klisk.core.builtin_tools",
+    "FileSearch": "klisk.core.builtin_tools",
+    "ImageGeneration": "klisk.core.builtin_tools",
+}
 
 __all__ = [
     "define_agent",
@@ -16,3 +36,16 @@ __all__ = [
     "FileSearch",
     "ImageGeneration",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'klisk' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import os
+import re
 import shutil
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from klisk.assistant.prompt import SYSTEM_PROMPT
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.markdown import Markdown
+    from rich.text import Text
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,31 +64,147 @@ def _patch_sdk_message_parser() -> None:
     internal_client._klisk_parser_patched = True
 
 
-def _has_claude_auth_session() -> bool:
-    import json
+def _is_logged_in(status_output: str | bytes) -> bool:
+    """Parse the JSON printed by `claude auth status`."""
+    try:
+        payload = json.loads(status_output.strip() or "{}")
+    except json.JSONDecodeError:
+        return False
+
+    return bool(payload.get("loggedIn"))
+
+
+# Set once `claude auth status` reports a session; a login does not expire
+# within the lifetime of the process, so it is not probed again.
+_auth_session_confirmed = False
+
+# A confirmed login is also remembered on disk for a short while, so starting
+# the assistant again soon after does not run the probe at all.
+_AUTH_CACHE_TTL = 10 * 60
+
+
+def _auth_cache_file() -> Path:
+    from klisk.core.paths import KLISK_HOME
+
+    return KLISK_HOME / ".cache" / "claude-auth"
+
+
+def _auth_recently_confirmed() -> bool:
+    global _auth_session_confirmed
+
+    if not _auth_session_confirmed:
+        try:
+            age = time.time() - _auth_cache_file().stat().st_mtime
+        except OSError:
+            return False
+        _auth_session_confirmed = age < _AUTH_CACHE_TTL
+    return _auth_session_confirmed
+
+
+def _record_auth_status(status_output: str | bytes) -> bool:
+    global _auth_session_confirmed
+
+    _auth_session_confirmed = _is_logged_in(status_output)
+    if _auth_session_confirmed:
+        cache_file = _auth_cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.touch()
+        except OSError:
+            pass
+    return _auth_session_confirmed
+
+
+def _start_auth_probe():  # type: ignore[no-untyped-def]
+    """Start `claude auth status` in the background if env auth is missing.
+
+    The probe runs while the SDK is imported; ``_ensure_auth`` collects it.
+    """
     import subprocess
 
+    # Cleared here too, since the probe starts before _ensure_auth runs.
+    os.environ.pop("CLAUDECODE", None)
+    if os.environ.get("ANTHROPIC_API_KEY") or os.environ.get("CLAUDE_CODE_OAUTH_TOKEN"):
+        return None
+    if _auth_recently_confirmed():
+        return None
     try:
-        result = subprocess.run(
+        return subprocess.Popen(
             ["claude", "auth", "status"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=5,
-            check=False,
         )
+    except Exception:
+        return None
+
+
+def _has_claude_auth_session(probe=None) -> bool:  # type: ignore[no-untyped-def]
+    import subprocess
+
+    if _auth_recently_confirmed():
+        if probe is not None:
+            probe.kill()
+            probe.wait()
+        return True
+
+    try:
+        if probe is None:
+            probe = subprocess.Popen(
+                ["claude", "auth", "status"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        stdout, _ = probe.communicate(timeout=2)
+    except subprocess.TimeoutExpired:
+        probe.kill()
+        probe.wait()
+        return False
     except Exception:
         return False
 
+    return _record_auth_status(stdout)
+
+
+async def _has_claude_auth_session_async(timeout: float = 1.0) -> bool:
+    """Non-blocking variant of `_has_claude_auth_session` for the event loop."""
+    if _auth_recently_confirmed():
+        return True
+
     try:
-        payload = json.loads(result.stdout.strip() or "{}")
-    except json.JSONDecodeError:
+        proc = await asyncio.create_subprocess_exec(
+            "claude", "auth", "status",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except Exception:
         return False
 
-    return bool(payload.get("loggedIn"))
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return False
+
+    return _record_auth_status(stdout)
+
 
+# Resolved claude binary; only a successful lookup is remembered so that
+# installing the CLI while Studio is running takes effect.
+_claude_path: str | None = None
 
-def _ensure_auth() -> None:
-    import os
+
+def _claude_cli_path() -> str | None:
+    """Locate the ``claude`` CLI, reusing the path once found."""
+    global _claude_path
+    if _claude_path is None:
+        _claude_path = shutil.which("claude")
+    return _claude_path
+
+
+def _ensure_auth(probe=None) -> None:  # type: ignore[no-untyped-def]
     import subprocess
 
     # Limpiar CLAUDECODE para evitar detección de sesión anidada
@@ -88,7 +215,7 @@ def _ensure_auth() -> None:
         return
 
     # Ya autenticado en Claude Code via `claude auth login`
-    if _has_claude_auth_session():
+    if _has_claude_auth_session(probe):
         return
 
     # Pedir login o token al usuario
@@ -130,8 +257,6 @@ def _ensure_auth() -> None:
 
 def _targets_env_file(tool_name: str, input_data: dict) -> bool:  # type: ignore[type-arg]
     """Return True if the tool use targets a .env file."""
-    import os
-
     if tool_name in ("Read", "Write", "Edit"):
         fp = input_data.get("file_path", "")
         basename = os.path.basename(fp)
@@ -150,50 +275,438 @@ def _targets_env_file(tool_name: str, input_data: dict) -> bool:  # type: ignore
     return False
 
 
-def _format_tool_detail(name: str, raw_json: str) -> str:
-    import json
+# Marks the end of the SDK message stream in the assistant's message queue.
+_STREAM_END = object()
+
+# Minimum time between repaints of the streamed reply (8 per second).
+_LIVE_REFRESH_INTERVAL = 1 / 8
+
+# Styles for tool indicators and CLI output lines. These are printed with
+# markup disabled, so tool input and subprocess text are shown verbatim.
+_DIM_STYLE = "dim"
+_STDERR_STYLE = "dim red"
+
+# Decoder for tool inputs. orjson is faster on these small objects and, like
+# json.loads, accepts the raw bytes buffer directly.
+try:
+    import orjson
+
+    _json_decode = orjson.loads
+except ImportError:
+    _json_decode = json.loads
+
+# Input field shown next to each tool name in the stream output.
+_TOOL_DETAIL_FIELDS = {
+    "Read": "file_path",
+    "Write": "file_path",
+    "Edit": "file_path",
+    "Bash": "command",
+    "Grep": "pattern",
+    "Glob": "pattern",
+}
+
+
+def _format_tool_detail(name: str, raw_json: bytes | bytearray | str) -> str:
+    # Skip parsing the input of tools that never show a detail.
+    field = _TOOL_DETAIL_FIELDS.get(name)
+    if field is None:
+        return ""
 
     try:
-        inp = json.loads(raw_json)
-    except (json.JSONDecodeError, ValueError):
+        inp = _json_decode(raw_json)
+    except ValueError:
         return ""
 
-    detail = ""
-    if name in ("Read", "Write", "Edit"):
-        detail = inp.get("file_path", "")
-    elif name == "Bash":
-        detail = inp.get("command", "")
-        if len(detail) > 60:
-            detail = detail[:57] + "..."
-    elif name == "Grep":
-        detail = inp.get("pattern", "")
-    elif name == "Glob":
-        detail = inp.get("pattern", "")
+    detail = inp.get(field, "") if isinstance(inp, dict) else ""
+    return _shorten_tool_detail(name, detail)
+
 
+def _shorten_tool_detail(name: str, detail: str) -> str:
+    if name == "Bash" and len(detail) > 60:
+        detail = detail[:57] + "..."
     return f": {detail}" if detail else ""
 
 
+# Structural characters of the tool input JSON, and the body of a string.
+_JSON_STRUCTURE = re.compile(rb'["{}\[\]:,]')
+_JSON_STRING_BODY = re.compile(rb'(?:[^"\\]|\\.)*')
+
+# Where _ToolDetailScanner is within the top-level input object.
+_EXPECT_KEY, _AFTER_FIELD, _FIELD_VALUE, _OTHER = range(4)
+
+
+class _ToolDetailScanner:
+    """Find a tool's detail field while its input JSON is still streaming.
+
+    Each ``scan`` resumes where the previous one stopped, so the input is read
+    once however it is split into deltas. Only a string value of a top-level
+    key counts; the same name inside another value or a nested object is
+    skipped.
+    """
+
+    __slots__ = ("_name", "_field", "_pos", "_depth", "_string_start", "_state")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._field = _TOOL_DETAIL_FIELDS[name].encode()
+        self._pos = 0
+        self._depth = 0
+        self._string_start = -1
+        self._state = _OTHER
+
+    def scan(self, partial_json: bytes | bytearray) -> str | None:
+        """Return the tool detail once its field is complete.
+
+        Returns None while the value is still streaming, so the caller can keep
+        buffering and fall back to ``_format_tool_detail`` at block stop.
+        """
+        pos = self._pos
+        while True:
+            if self._string_start >= 0:
+                pos = _JSON_STRING_BODY.match(partial_json, pos).end()
+                if partial_json[pos:pos + 1] != b'"':
+                    # Cut off mid-string (possibly right after a backslash).
+                    self._pos = pos
+                    return None
+                value = partial_json[self._string_start:pos]
+                self._string_start = -1
+                pos += 1
+                if self._depth != 1:
+                    continue
+                if self._state == _FIELD_VALUE:
+                    return self._decode(value)
+                if self._state == _EXPECT_KEY:
+                    self._state = _AFTER_FIELD if value == self._field else _OTHER
+                continue
+
+            match = _JSON_STRUCTURE.search(partial_json, pos)
+            if match is None:
+                self._pos = len(partial_json)
+                return None
+            char = match.group()
+            pos = match.end()
+            if char == b'"':
+                self._string_start = pos
+            elif char in b"{[":
+                self._depth += 1
+                self._state = _EXPECT_KEY if self._depth == 1 and char == b"{" else _OTHER
+            elif char in b"}]":
+                self._depth -= 1
+            elif self._depth == 1:
+                if char == b":":
+                    self._state = _FIELD_VALUE if self._state == _AFTER_FIELD else _OTHER
+                else:
+                    self._state = _EXPECT_KEY
+
+    def _decode(self, value: bytes | bytearray) -> str | None:
+        try:
+            detail = _json_decode(b'"' + value + b'"')
+        except ValueError:
+            return None
+        return _shorten_tool_detail(self._name, detail)
+
+
+_rich_classes: tuple[type, type, type, Any] | None = None
+
+
+def _rich_streaming_classes() -> tuple[type, type, type, Any]:
+    """Import the Rich pieces used for streaming once, on the first reply."""
+    global _rich_classes
+    if _rich_classes is None:
+        from rich.live import Live
+        from rich.markdown import Markdown
+        from rich.segment import Segment
+        from rich.text import Text
+
+        _rich_classes = (Markdown, Text, Live, Segment.line())
+    return _rich_classes
+
+
+# A single-line block with no Markdown syntax renders exactly like plain
+# text, so it can skip the Markdown parser.
+_PLAIN_BLOCK = re.compile(r"(?![-+=\s]|\d+[.)](?:\s|$))[^\n`*_\[\]#>|<&\\~]+\Z")
+
+# A line after a blank line that may still belong to the block before it:
+# an indented line (list item continuation or indented code) or a list item
+# (the next item of a loose list).
+_CONTINUES_BLOCK = re.compile(r"[ \t]|[-+*][ \t]|\d+[.)][ \t]")
+
+# Blank lines at the start of a block.
+_LEADING_BLANK_LINES = re.compile(r"\A(?:[ \t]*\n)+")
+
+
+class _IncrementalMarkdown:
+    """Live renderable that parses each completed Markdown block only once.
+
+    Completed blocks are cached as ``Markdown`` objects, or as plain
+    ``Text`` when they use no Markdown syntax; only the block still being
+    streamed is re-parsed when the display refreshes. A block is complete
+    once a blank line outside a code fence is followed by a line that cannot
+    continue it, so the blocks render exactly as the whole text would.
+    """
+
+    def __init__(self) -> None:
+        self._markdown, self._text, self._live, self._new_line = _rich_streaming_classes()
+        self._blocks: list[Markdown | Text] = []
+        self._tail = ""
+        # Chunks without a newline can't complete a line; they are only
+        # joined onto the tail when one arrives or when rendering.
+        self._pending: list[str] = []
+        # Scan state for the tail, so each streamed line is inspected once.
+        self._scan_pos = 0
+        self._in_fence = False
+        self._has_content = False
+        # End of the tail's first block when a blank line was seen after it,
+        # until the next line shows whether the block really ended there.
+        self._block_end: int | None = None
+        self._tail_render: tuple[str, Markdown | Text] | None = None
+
+    @staticmethod
+    def _trim(block: str) -> str:
+        # Leading indentation is significant (indented code), blank lines are not.
+        return _LEADING_BLANK_LINES.sub("", block, count=1).rstrip()
+
+    def _parse(self, block: str) -> Markdown | Text:
+        if _PLAIN_BLOCK.match(block):
+            return self._text(block)
+        return self._markdown(block)
+
+    def live(self, console: Console) -> Live:
+        """Return a manually refreshed Live display of this view."""
+        return self._live(self, console=console, auto_refresh=False)
+
+    def _joined_tail(self) -> str:
+        if self._pending:
+            self._tail += "".join(self._pending)
+            self._pending.clear()
+        return self._tail
+
+    def feed(self, chunk: str) -> None:
+        if "\n" not in chunk:
+            self._pending.append(chunk)
+            return
+        tail = self._joined_tail() + chunk
+        pos = self._scan_pos
+        while True:
+            nl = tail.find("\n", pos)
+            if nl < 0:
+                break
+            raw = tail[pos:nl]
+            line = raw.strip()
+            if line and self._block_end is not None:
+                if not _CONTINUES_BLOCK.match(raw):
+                    self._blocks.append(self._parse(self._trim(tail[:self._block_end])))
+                    tail = tail[pos:]
+                    nl -= pos
+                    pos = 0
+                self._block_end = None
+            start, pos = pos, nl + 1
+            if line.startswith(("```", "~~~")):
+                self._in_fence = not self._in_fence
+                self._has_content = True
+            elif line:
+                self._has_content = True
+            elif self._has_content and not self._in_fence and self._block_end is None:
+                self._block_end = start
+        self._tail = tail
+        self._scan_pos = pos
+
+    def finish(self) -> None:
+        """Render whatever is left as a completed block."""
+        block = self._trim(self._joined_tail())
+        if block:
+            self._blocks.append(self._parse(block))
+        self._tail = ""
+        self._scan_pos = 0
+        self._in_fence = False
+        self._has_content = False
+        self._block_end = None
+        self._tail_render = None
+
+    def __rich_console__(self, console, options):  # type: ignore[no-untyped-def]
+        blocks: list[Markdown | Text] = self._blocks
+        tail = self._trim(self._joined_tail())
+        if tail:
+            if self._tail_render is None or self._tail_render[0] != tail:
+                self._tail_render = (tail, self._parse(tail))
+            blocks = [*blocks, self._tail_render[1]]
+
+        for i, block in enumerate(blocks):
+            if isinstance(block, self._text):
+                segments = self._plain_segments(console, options, block)
+            else:
+                segments = iter(console.render(block, options))
+            first = next(segments, None)
+            if first is None:
+                # An empty block (raw HTML) still gets its separator.
+                if i:
+                    yield self._new_line
+                continue
+            # Separate blocks by a blank line, as a single Markdown would.
+            # Lists and quotes already start with one.
+            if i and first.text != "\n":
+                yield self._new_line
+            yield first
+            yield from segments
+
+    def _plain_segments(self, console, options, text):  # type: ignore[no-untyped-def]
+        # Pad lines to the full width, as a Markdown paragraph does.
+        for line in console.render_lines(text, options, pad=True):
+            yield from line
+            yield self._new_line
+
+
+class _TextBlock:
+    """A streamed text block, shown in a Live view repainted at a capped rate."""
+
+    __slots__ = ("_view", "_live", "_loop", "_refresh_pending", "_last_refresh")
+
+    delta_type = "text_delta"
+
+    def __init__(self, console: Console) -> None:
+        self._view = _IncrementalMarkdown()
+        self._live: Live | None = self._view.live(console)
+        self._live.start()
+        self._loop = asyncio.get_running_loop()
+        self._refresh_pending = False
+        self._last_refresh = 0.0
+
+    def delta(self, delta: dict) -> None:  # type: ignore[type-arg]
+        self._view.feed(delta.get("text", ""))
+        # Deltas are coalesced: repaint at most once per interval, with a
+        # trailing repaint so the last tokens always show.
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            delay = self._last_refresh + _LIVE_REFRESH_INTERVAL - time.monotonic()
+            self._loop.call_later(max(delay, 0.0), self._refresh)
+
+    def _refresh(self) -> None:
+        self._refresh_pending = False
+        if self._live is not None:
+            self._live.refresh()
+            self._last_refresh = time.monotonic()
+
+    def stop(self) -> None:
+        if self._live is not None:
+            self._view.finish()
+            self._live.stop()
+            self._live = None
+
+
+class _ToolBlock:
+    """A tool_use block, shown as a one-line ``> Tool: detail`` indicator."""
+
+    __slots__ = ("_name", "_buffer", "_scanner", "_shown", "_print")
+
+    delta_type = "input_json_delta"
+
+    def __init__(self, name: str, print_line) -> None:  # type: ignore[no-untyped-def]
+        self._name = name
+        # Only tools with a detail line need their input JSON collected.
+        self._buffer: bytearray | None = None
+        self._scanner: _ToolDetailScanner | None = None
+        if name in _TOOL_DETAIL_FIELDS:
+            self._buffer = bytearray()
+            self._scanner = _ToolDetailScanner(name)
+        self._shown = False
+        self._print = print_line
+
+    def delta(self, delta: dict) -> None:  # type: ignore[type-arg]
+        if self._buffer is None:
+            return
+        self._buffer.extend(delta.get("partial_json", "").encode())
+        # Show the indicator as soon as the detail field is complete and
+        # stop buffering the rest of the input.
+        detail = self._scanner.scan(self._buffer)  # type: ignore[union-attr]
+        if detail is not None:
+            self._show(detail)
+            self._buffer = None
+            self._scanner = None
+
+    def stop(self) -> None:
+        if not self._shown:
+            self._show(_format_tool_detail(self._name, self._buffer or b""))
+        self._buffer = None
+        self._scanner = None
+
+    def _show(self, detail: str) -> None:
+        self._print("  > " + self._name + detail, style=_DIM_STYLE, markup=False)
+        self._shown = True
+
+
+async def _read_input(console, prompt: str) -> str:  # type: ignore[no-untyped-def]
+    """Read a line of user input without blocking the event loop.
+
+    The read runs in a daemon thread so the SDK stream keeps being served
+    while the user types, and a pending read never delays interpreter exit.
+    """
+    import threading
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def _deliver(result: str | None, exc: Exception | None) -> None:
+        if future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result or "")
+
+    def _reader() -> None:
+        try:
+            result = console.input(prompt)
+        except Exception as e:
+            outcome: tuple[str | None, Exception | None] = (None, e)
+        else:
+            outcome = (result, None)
+        try:
+            loop.call_soon_threadsafe(_deliver, *outcome)
+        except RuntimeError:
+            pass  # event loop already closed
+
+    threading.Thread(target=_reader, name="klisk-input", daemon=True).start()
+    return await future
+
+
+def _snapshot_sdk_env() -> dict[str, str]:
+    """Collect the environment variables passed to the Claude subprocess."""
+    # Ensure CLAUDECODE is cleared to avoid nested session detection
+    os.environ.pop("CLAUDECODE", None)
+
+    sdk_env: dict[str, str] = {}
+    # Include PATH so the subprocess can find klisk and other CLI tools
+    path = os.environ.get("PATH")
+    if path:
+        sdk_env["PATH"] = path
+    for key in ("ANTHROPIC_API_KEY", "CLAUDE_CODE_OAUTH_TOKEN"):
+        val = os.environ.get(key)
+        if val:
+            sdk_env[key] = val
+    return sdk_env
+
+
 async def _run_loop(cwd: Path, model: str) -> None:
     from claude_agent_sdk import ClaudeAgentOptions, HookMatcher, ResultMessage, query
     from claude_agent_sdk.types import (
         PermissionResultAllow,
         PermissionResultDeny,
         StreamEvent,
+        SystemMessage,
     )
     from rich.console import Console
-    from rich.live import Live
-    from rich.markdown import Markdown
 
     console = Console()
+    cprint = console.print
 
-    console.print()
-    console.print(f"  [bold green]Klisk Assistant[/bold green] [dim]({model})[/dim]")
-    console.print(f"  [dim]Working in:[/dim] {cwd}")
-    console.print("  [dim]Type 'exit' or Ctrl+C to quit.[/dim]")
-    console.print()
+    cprint()
+    cprint(f"  [bold green]Klisk Assistant[/bold green] [dim]({model})[/dim]")
+    cprint(f"  [dim]Working in:[/dim] {cwd}")
+    cprint("  [dim]Type 'exit' or Ctrl+C to quit.[/dim]")
+    cprint()
 
     # Use the same Claude binary available in the user's PATH so auth state matches.
-    cli_path = shutil.which("claude")
+    cli_path = _claude_cli_path()
 
     async def _auto_approve_klisk(input_data, tool_use_id, context):  # type: ignore[no-untyped-def]
         """Auto-approve klisk CLI commands; defer to permission mode for others."""
@@ -230,13 +743,13 @@ async def _run_loop(cwd: Path, model: str) -> None:
             questions = input_data.get("questions", [])
             answers: dict[str, str] = {}
             for q in questions:
-                console.print(f"\n  [bold]{q.get('question', '')}[/bold]")
+                cprint(f"\n  [bold]{q.get('question', '')}[/bold]")
                 options = q.get("options", [])
                 for i, opt in enumerate(options, 1):
                     label = opt.get("label", "")
                     desc = opt.get("description", "")
-                    console.print(f"    [cyan]{i}.[/cyan] {label}" + (f" [dim]— {desc}[/dim]" if desc else ""))
-                console.print(f"    [cyan]{len(options) + 1}.[/cyan] Other")
+                    cprint(f"    [cyan]{i}.[/cyan] {label}" + (f" [dim]— {desc}[/dim]" if desc else ""))
+                cprint(f"    [cyan]{len(options) + 1}.[/cyan] Other")
                 try:
                     choice = console.input("\n  [yellow]Choice:[/yellow] ").strip()
                 except (EOFError, KeyboardInterrupt):
@@ -281,15 +794,146 @@ async def _run_loop(cwd: Path, model: str) -> None:
         stripped = line.rstrip()
         if not stripped or "Error in hook callback" in stripped:
             return
-        console.print(f"  [dim red]{stripped}[/dim red]")
+        cprint("  " + stripped, style=_STDERR_STYLE, markup=False)
 
     session_id: str | None = None
 
+    # A single `query()` stream is kept open for the whole session so the
+    # `claude` subprocess is reused across turns; each user message is pushed
+    # into the stream through `msg_queue`. The stream is reopened (resuming
+    # the session) only after an interruption or error.
+    #
+    # The stream is iterated by its own task (`sdk_task`), which forwards SDK
+    # messages through `sdk_queue`, so reading from the SDK overlaps with
+    # rendering and the SDK's cancel scopes stay within a single task.
+    msg_queue: asyncio.Queue[str] | None = None
+    sdk_queue: asyncio.Queue[object] | None = None
+    sdk_task: asyncio.Task[None] | None = None
+
+    # The environment is read once per session rather than on every turn,
+    # and read again only when a stream is reopened after an SDK error.
+    sdk_env = _snapshot_sdk_env()
+    env_stale = False
+
+    # Options are built once per session and reused whenever a stream opens.
+    options = ClaudeAgentOptions(
+        model=model,
+        system_prompt=SYSTEM_PROMPT,
+        include_partial_messages=True,
+        allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep", "Skill", "AskUserQuestion"],
+        setting_sources=["user"],
+        permission_mode="acceptEdits",
+        hooks={
+            "PreToolUse": [
+                HookMatcher(matcher="Bash", hooks=[_auto_approve_klisk]),
+            ],
+        },
+        can_use_tool=_can_use_tool,
+        cwd=str(cwd),
+        max_turns=None,
+        env=sdk_env,
+        cli_path=cli_path,
+        stderr=_on_stderr,
+    )
+
+    async def _open_stream():  # type: ignore[no-untyped-def]
+        nonlocal sdk_env, env_stale
+        if env_stale:
+            sdk_env = options.env = _snapshot_sdk_env()
+            env_stale = False
+
+        # Debug: show which auth source is being used
+        auth_keys = ", ".join(
+            key for key in ("ANTHROPIC_API_KEY", "CLAUDE_CODE_OAUTH_TOKEN") if key in sdk_env
+        )
+        if auth_keys:
+            cprint(f"  [dim]Auth: {auth_keys}[/dim]")
+        elif await _has_claude_auth_session_async():
+            cprint("  [dim]Auth: claude auth session[/dim]")
+        else:
+            cprint("  [bold red]Warning: No auth tokens found in env![/bold red]")
+
+        # Only `resume` differs between streams of the same session.
+        options.resume = session_id
+
+        queue: asyncio.Queue[str] = asyncio.Queue()
+
+        async def _prompt_stream():  # type: ignore[no-untyped-def]
+            while True:
+                content = await queue.get()
+                yield {"type": "user", "message": {"role": "user", "content": content}}
+
+        # Bounded, so a long reply cannot pile up unrendered in memory.
+        messages: asyncio.Queue[object] = asyncio.Queue(maxsize=64)
+
+        async def _iterate_sdk() -> None:
+            stream = query(prompt=_prompt_stream(), options=options)
+            try:
+                async for message in stream:
+                    await messages.put(message)
+            except Exception as exc:
+                await messages.put(exc)
+            else:
+                await messages.put(_STREAM_END)
+            finally:
+                try:
+                    await stream.aclose()
+                except Exception:
+                    logger.debug("Error closing assistant stream", exc_info=True)
+
+        return queue, messages, asyncio.create_task(_iterate_sdk())
+
+    async def _close_stream() -> None:
+        nonlocal msg_queue, sdk_queue, sdk_task
+        if sdk_task is not None:
+            sdk_task.cancel()
+            try:
+                await sdk_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        msg_queue = None
+        sdk_queue = None
+        sdk_task = None
+
+    # Block being streamed in the current turn, updated by the handlers below.
+    current: _TextBlock | _ToolBlock | None = None
+
+    def _on_block_start(event: dict) -> None:  # type: ignore[type-arg]
+        nonlocal current
+        if type(current) is _TextBlock:
+            current.stop()
+        block = event.get("content_block", {})
+        block_type = block.get("type")
+        if block_type == "tool_use":
+            current = _ToolBlock(block.get("name", ""), cprint)
+        elif block_type == "text":
+            current = _TextBlock(console)
+        else:
+            current = None
+
+    def _on_block_delta(event: dict) -> None:  # type: ignore[type-arg]
+        delta = event.get("delta", {})
+        if current is not None and delta.get("type") == current.delta_type:
+            current.delta(delta)
+
+    def _on_block_stop(event: dict) -> None:  # type: ignore[type-arg]
+        nonlocal current
+        if current is not None:
+            current.stop()
+            current = None
+
+    event_handlers = {
+        "content_block_start": _on_block_start,
+        "content_block_delta": _on_block_delta,
+        "content_block_stop": _on_block_stop,
+    }
+
     while True:
         try:
-            user_input = console.input("[bold green]You:[/bold green] ")
-        except (EOFError, KeyboardInterrupt):
-            console.print()
+            user_input = await _read_input(console, "[bold green]You:[/bold green] ")
+        except (EOFError, KeyboardInterrupt, asyncio.CancelledError):
+            # Ctrl+C while waiting cancels the main task instead of raising.
+            cprint()
             break
 
         stripped = user_input.strip()
@@ -298,151 +942,121 @@ async def _run_loop(cwd: Path, model: str) -> None:
         if not stripped:
             continue
 
-        import os
-
-        # Ensure CLAUDECODE is cleared to avoid nested session detection
-        os.environ.pop("CLAUDECODE", None)
-
-        sdk_env: dict[str, str] = {}
-        # Include PATH so the subprocess can find klisk and other CLI tools
-        path = os.environ.get("PATH")
-        if path:
-            sdk_env["PATH"] = path
-        for key in ("ANTHROPIC_API_KEY", "CLAUDE_CODE_OAUTH_TOKEN"):
-            val = os.environ.get(key)
-            if val:
-                sdk_env[key] = val
-
-        # Debug: show which auth source is being used
-        if sdk_env:
-            auth_keys = ", ".join(sdk_env.keys())
-            console.print(f"  [dim]Auth: {auth_keys}[/dim]")
-        elif _has_claude_auth_session():
-            console.print("  [dim]Auth: claude auth session[/dim]")
-        else:
-            console.print("  [bold red]Warning: No auth tokens found in env![/bold red]")
-
-        options = ClaudeAgentOptions(
-            model=model,
-            system_prompt=SYSTEM_PROMPT,
-            include_partial_messages=True,
-            allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep", "Skill", "AskUserQuestion"],
-            setting_sources=["user"],
-            permission_mode="acceptEdits",
-            hooks={
-                "PreToolUse": [
-                    HookMatcher(matcher="Bash", hooks=[_auto_approve_klisk]),
-                ],
-            },
-            can_use_tool=_can_use_tool,
-            cwd=str(cwd),
-            max_turns=None,
-            env=sdk_env,
-            cli_path=cli_path,
-            stderr=_on_stderr,
-        )
+        if sdk_task is not None and sdk_task.done():
+            # The claude subprocess exited after the previous turn; its end
+            # marker is still queued, so start a fresh stream instead.
+            await _close_stream()
+        if sdk_task is None:
+            msg_queue, sdk_queue, sdk_task = await _open_stream()
+        assert msg_queue is not None and sdk_queue is not None
+        await msg_queue.put(stripped)
+
+        cprint()
+        current = None
+        replied = False
+        resent = False
+        try:
+            while True:
+                message = await sdk_queue.get()
 
-        if session_id:
-            options.resume = session_id
+                # Stream events arrive once per delta, so check them first.
+                if type(message) is StreamEvent:
+                    replied = True
+                    event = message.event
+                    handler = event_handlers.get(event.get("type"))
+                    if handler:
+                        handler(event)
 
-        console.print()
-        text_buffer = ""
-        tool_input_buffer = ""
-        current_tool = ""
-        in_tool = False
-        live: Live | None = None
-        try:
-            async def _prompt():  # type: ignore[no-untyped-def]
-                yield {"type": "user", "message": {"role": "user", "content": stripped}}
+                elif type(message) is ResultMessage:
+                    if type(current) is _TextBlock:
+                        current.stop()
+                    current = None
+                    # End of this turn; keep the stream open for the next one.
+                    break
 
-            async for message in query(prompt=_prompt(), options=options):
                 # Capture session ID from init message
-                if (
-                    hasattr(message, "subtype")
-                    and message.subtype == "init"
-                    and hasattr(message, "data")
-                ):
+                elif type(message) is SystemMessage and message.subtype == "init":
                     session_id = message.data.get("session_id", session_id)
 
-                elif isinstance(message, StreamEvent):
-                    event = message.event
-                    event_type = event.get("type")
-
-                    if event_type == "content_block_start":
-                        block = event.get("content_block", {})
-                        if block.get("type") == "tool_use":
-                            if live:
-                                live.stop()
-                                live = None
-                                text_buffer = ""
-                            current_tool = block.get("name", "")
-                            tool_input_buffer = ""
-                            in_tool = True
-                        elif block.get("type") == "text":
-                            text_buffer = ""
-                            live = Live(
-                                Markdown(text_buffer),
-                                console=console,
-                                refresh_per_second=8,
-                            )
-                            live.start()
-
-                    elif event_type == "content_block_delta":
-                        delta = event.get("delta", {})
-                        if delta.get("type") == "text_delta" and not in_tool:
-                            text_buffer += delta.get("text", "")
-                            if live:
-                                live.update(Markdown(text_buffer))
-                        elif delta.get("type") == "input_json_delta" and in_tool:
-                            tool_input_buffer += delta.get("partial_json", "")
-
-                    elif event_type == "content_block_stop":
-                        if in_tool:
-                            detail = _format_tool_detail(
-                                current_tool, tool_input_buffer
-                            )
-                            console.print(
-                                f"  [dim]> {current_tool}{detail}[/dim]"
-                            )
-                            in_tool = False
-                        elif live:
-                            live.stop()
-                            live = None
-                            text_buffer = ""
-
-                elif isinstance(message, ResultMessage):
-                    if live:
-                        live.stop()
-                        live = None
+                elif message is _STREAM_END:
+                    # The stream ended before finishing this turn.
+                    await _close_stream()
+                    if replied or resent:
+                        raise RuntimeError("The assistant session ended before finishing its reply")
+                    # The subprocess exited before reading the message;
+                    # send it once more on a new stream.
+                    msg_queue, sdk_queue, sdk_task = await _open_stream()
+                    await msg_queue.put(stripped)
+                    resent = True
+
+                elif isinstance(message, Exception):
+                    raise message
 
         except KeyboardInterrupt:
-            if live:
-                live.stop()
-            console.print("\n  [dim](interrupted)[/dim]")
+            if type(current) is _TextBlock:
+                current.stop()
+            cprint("\n  [dim](interrupted)[/dim]")
+            await _close_stream()
         except Exception as e:
-            if live:
-                live.stop()
-            console.print(f"\n  [bold red]Error:[/bold red] {e}")
+            if type(current) is _TextBlock:
+                current.stop()
+            cprint(f"\n  [bold red]Error:[/bold red] {e}")
             # Show subprocess details if available
             if hasattr(e, "stderr") and e.stderr:
-                console.print(f"  [dim red]{e.stderr}[/dim red]")
+                cprint(f"  {e.stderr}", style=_STDERR_STYLE, markup=False)
             if hasattr(e, "stdout") and e.stdout:
-                console.print(f"  [dim]{e.stdout}[/dim]")
+                cprint(f"  {e.stdout}", style=_DIM_STYLE, markup=False)
+            await _close_stream()
+            env_stale = True
+
+        cprint()
+
+    await _close_stream()
+
 
-        console.print()
+def _run_event_loop(main) -> None:  # type: ignore[no-untyped-def]
+    """Run *main* on uvloop when it is installed, else on the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+        return
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main)
+    else:
+        uvloop.install()
+        asyncio.run(main)
 
 
 def run_assistant(cwd: Path, *, model: str = "opus") -> None:
     """Start the interactive assistant loop."""
-    if not _check_sdk_installed():
-        print(
-            "Error: claude-agent-sdk is not installed.\n"
-            "Install it with: pip install 'klisk[assistant]'",
-            file=sys.stderr,
-        )
-        raise SystemExit(1)
+    # Overlap the auth check with the SDK import below.
+    auth_probe = _start_auth_probe()
 
-    _patch_sdk_message_parser()
-    _ensure_auth()
+    try:
+        if not _check_sdk_installed():
+            print(
+                "Error: claude-agent-sdk is not installed.\n"
+                "Install it with: pip install 'klisk[assistant]'",
+                file=sys.stderr,
+            )
+            raise SystemExit(1)
+
+        _patch_sdk_message_parser()
+    except BaseException:
+        # Don't leave the probe running when exiting before it is read.
+        if auth_probe is not None:
+            auth_probe.kill()
+            auth_probe.wait()
+        raise
 
-    asyncio.run(_run_loop(cwd, model))
+    _ensure_auth(auth_probe)
+
+    try:
+        _run_event_loop(_run_loop(cwd, model))
+    except KeyboardInterrupt:
+        # On Python 3.10 Ctrl+C is raised out of the event loop rather than
+        # cancelling the pending input read, so the loop can't handle it.
+        print()
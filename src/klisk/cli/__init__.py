@@ -1,23 +1,51 @@
 """Klisk CLI powered by Typer."""
 
+from __future__ import annotations
+
+import importlib
+import os
+from pathlib import Path
+
+import click
 import typer
+from typer.core import TyperGroup
+
+# Subcommands are imported only when dispatched, so `klisk <command>` does
+# not load the dependencies of every other command.
+_COMMANDS: dict[str, tuple[str, str]] = {
+    "assistant": ("klisk.cli.assistant", "assistant"),
+    "create": ("klisk.cli.create", "create"),
+    "delete": ("klisk.cli.delete", "delete"),
+    "studio": ("klisk.cli.studio", "studio"),
+    "run": ("klisk.cli.run", "run"),
+    "check": ("klisk.cli.check", "check"),
+    "list": ("klisk.cli.list_projects", "list_cmd"),
+    "start": ("klisk.cli.start", "start"),
+    "config": ("klisk.cli.config", "config"),
+    "docker": ("klisk.cli.docker", "docker"),
+    "status": ("klisk.cli.status", "status"),
+}
+
+
+class _LazyGroup(TyperGroup):
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return list(_COMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        target = _COMMANDS.get(cmd_name)
+        if target is None:
+            return None
+        module_name, attr = target
+        command_app = typer.Typer(add_completion=False)
+        command_app.command(cmd_name)(getattr(importlib.import_module(module_name), attr))
+        return typer.main.get_command(command_app)
 
-from klisk.cli.assistant import assistant
-from klisk.cli.create import create
-from klisk.cli.delete import delete
-from klisk.cli.studio import studio
-from klisk.cli.run import run
-from klisk.cli.check import check
-from klisk.cli.list_projects import list_cmd
-from klisk.cli.start import start
-from klisk.cli.config import config
-from klisk.cli.status import status
-from klisk.cli.docker import docker
 
 app = typer.Typer(
     name="klisk",
     help="A framework for building AI agents programmatically.",
     add_completion=False,
+    cls=_LazyGroup,
 )
 
 
@@ -38,29 +66,41 @@ def main(ctx: typer.Context) -> None:
     get_projects_dir()  # creates ~/klisk/ and ~/klisk/projects/
     install_skill(KLISK_HOME)  # downloads skill to ~/.agents/skills/ + symlink for Claude
 
-    home_display = f"~/{KLISK_HOME.relative_to(KLISK_HOME.parent)}"
+    home_display = f"~/{KLISK_HOME.name}"
 
     if first_run:
-        _welcome_first_run(ui, home_display)
+        with ui.batched():
+            _welcome_first_run(ui, home_display)
         return
 
-    # Count projects (dirs with klisk.config.yaml)
-    projects = [
-        d for d in PROJECTS_DIR.iterdir()
-        if d.is_dir() and (d / "klisk.config.yaml").exists()
-    ] if PROJECTS_DIR.exists() else []
+    project_count = _count_projects(PROJECTS_DIR)
 
     # Check if studio is running
     from klisk.core.daemon import read_pid_info
 
     studio_info = read_pid_info(None)  # workspace mode
 
-    if not projects:
-        _welcome_no_projects(ui, home_display)
-    elif studio_info:
-        _welcome_studio_running(ui, studio_info, len(projects))
-    else:
-        _welcome_studio_off(ui, len(projects))
+    with ui.batched():
+        if not project_count:
+            _welcome_no_projects(ui, home_display)
+        elif studio_info:
+            _welcome_studio_running(ui, studio_info, project_count)
+        else:
+            _welcome_studio_off(ui, project_count)
+
+
+def _count_projects(projects_dir: Path) -> int:
+    """Count the directories in *projects_dir* that contain a klisk.config.yaml."""
+    count = 0
+    try:
+        # scandir entries carry the file type, so only the config is stat'ed.
+        with os.scandir(projects_dir) as it:
+            for entry in it:
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "klisk.config.yaml")):
+                    count += 1
+    except FileNotFoundError:
+        pass
+    return count
 
 
 def _welcome_first_run(ui, home_display: str) -> None:
@@ -108,16 +148,3 @@ def _welcome_studio_off(ui, project_count: int) -> None:
     ui.dim("Start the Studio to configure and test your agents:")
     ui.dim("  klisk studio")
     ui.plain()
-
-
-app.command()(assistant)
-app.command()(create)
-app.command()(delete)
-app.command()(studio)
-app.command()(run)
-app.command()(check)
-app.command("list")(list_cmd)
-app.command()(start)
-app.command()(config)
-app.command()(docker)
-app.command()(status)
@@ -10,26 +10,14 @@ from __future__ import annotations
 
 import argparse
 import signal
+import sys
 from pathlib import Path
 
 
-def _ignore_sighup() -> None:
-    """Ignore SIGHUP so the process survives terminal close."""
-    if hasattr(signal, "SIGHUP"):
-        signal.signal(signal.SIGHUP, signal.SIG_IGN)
-
-
-def _handle_sigterm() -> None:
-    """Convert SIGTERM into a clean SystemExit."""
-    def _on_sigterm(signum, frame):
-        raise SystemExit(0)
-
-    signal.signal(signal.SIGTERM, _on_sigterm)
-
-
 def main() -> None:
-    _ignore_sighup()
-    _handle_sigterm()
+    # The spawner starts this process in its own session (setsid), so it is
+    # already detached from the terminal's SIGHUP. SIGTERM exits cleanly.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--port", type=int, required=True)
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from pathlib import Path
 
 import typer
 
 from klisk.cli import ui
-from klisk.core.config import ProjectConfig
-from klisk.core.paths import resolve_project
 
 
+VALID_EFFORTS = frozenset({"none", "minimal", "low", "medium", "high", "xhigh"})
+_VALID_EFFORTS_STR = ", ".join(sorted(VALID_EFFORTS))
+OPENAI_ONLY_EFFORTS = frozenset({"minimal", "xhigh"})
+
+# An o-series name, or "gpt-N" followed by a version separator or the end of the name.
+_REASONING_MODEL_RE = re.compile(r"o|gpt-(\d+)(?:[.-]|$)")
+
+
+@functools.lru_cache(maxsize=64)
 def _supports_reasoning(model: str | None) -> bool:
     """Check if an OpenAI model supports the reasoning_effort parameter.
 
@@ -20,22 +29,11 @@ def _supports_reasoning(model: str | None) -> bool:
     if model is None:
         return True  # default model (gpt-5.2) supports it
 
-    base = model.removeprefix("openai/")
-
-    # o-series models (o1, o3, o4-mini, etc.)
-    if base.startswith("o"):
-        return True
-
-    # gpt-N models: supported if N >= 5
-    if base.startswith("gpt-"):
-        version_part = base[4:]  # e.g. "5.2", "4.1", "4o", "4o-mini"
-        try:
-            major = int(version_part.split(".")[0].split("-")[0])
-            return major >= 5
-        except ValueError:
-            return False
-
-    return False
+    match = _REASONING_MODEL_RE.match(model.removeprefix("openai/"))
+    if match is None:
+        return False
+    major = match.group(1)
+    return major is None or int(major) >= 5
 
 
 def check(
@@ -43,6 +41,9 @@ def check(
     agent: str | None = typer.Option(None, "--agent", "-a", help="Check only a specific agent by name"),
 ) -> None:
     """Validate that the project is well-formed."""
+    from klisk.core.config import ProjectConfig
+    from klisk.core.paths import resolve_project
+
     project_path = resolve_project(name_or_path)
     errors: list[str] = []
     warnings: list[str] = []
@@ -63,13 +64,14 @@ def check(
 
     # 2. Entry point
     entry_path = project_path / config.entry
-    if entry_path.exists():
+    entry_exists = entry_path.exists()
+    if entry_exists:
         ok.append(f"Entry point: {config.entry}")
     else:
         errors.append(f"Entry point not found: {config.entry}")
 
     # 3. Try to discover agents and tools
-    if entry_path.exists():
+    if entry_exists:
         try:
             from klisk.core.discovery import discover_project
 
@@ -86,14 +88,12 @@ def check(
                     agents_to_check = {agent: snapshot.agents[agent]}
                     ok.append(f"Checking agent: {agent}")
 
-                    # Collect only tools used by this agent
-                    agent_tool_names = {
-                        t for t in agents_to_check[agent].tools
-                        if not t.startswith("builtin:")
-                    }
+                    # Collect only tools used by this agent, walking the
+                    # agent's (short) tool list rather than every project tool.
                     tools_to_check = {
-                        n: t for n, t in snapshot.tools.items()
-                        if n in agent_tool_names
+                        n: snapshot.tools[n]
+                        for n in agents_to_check[agent].tools
+                        if not n.startswith("builtin:") and n in snapshot.tools
                     }
                     ok.append(f"{len(tools_to_check)} tool(s) used by '{agent}'")
             else:
@@ -105,20 +105,14 @@ def check(
             if agent and agent not in snapshot.agents:
                 pass  # already reported error above
             else:
-                # 4. Count builtin tools across checked agents
+                # 4-6. One pass over the checked agents: collect builtin tools,
+                # check model_settings misuse and validate reasoning_effort.
                 builtin_names = set()
-                for agent_entry in agents_to_check.values():
-                    for t in agent_entry.tools:
-                        if t.startswith("builtin:"):
-                            builtin_names.add(t)
-                if builtin_names:
-                    ok.append(f"{len(builtin_names)} builtin tool(s): {', '.join(sorted(builtin_names))}")
-
-                # 5. Check for model_settings misuse
                 for agent_name, agent_entry in agents_to_check.items():
-                    sdk_agent = agent_entry.sdk_agent
-                    if sdk_agent and hasattr(sdk_agent, "model_settings") and sdk_agent.model_settings:
-                        ms = sdk_agent.model_settings
+                    builtin_names.update(t for t in agent_entry.tools if t.startswith("builtin:"))
+
+                    ms = getattr(agent_entry.sdk_agent, "model_settings", None)
+                    if ms:
                         # Check if temperature was set via model_settings instead of define_agent param
                         if ms.temperature is not None and agent_entry.temperature is None:
                             errors.append(
@@ -132,10 +126,6 @@ def check(
                                 f"define_agent() parameter, not inside model_settings"
                             )
 
-                # 6. Validate reasoning_effort values
-                VALID_EFFORTS = {"none", "minimal", "low", "medium", "high", "xhigh"}
-                OPENAI_ONLY_EFFORTS = {"minimal", "xhigh"}
-                for agent_name, agent_entry in agents_to_check.items():
                     effort = agent_entry.reasoning_effort
                     if not effort:
                         continue
@@ -143,7 +133,7 @@ def check(
                         errors.append(
                             f"Agent '{agent_name}': invalid reasoning_effort "
                             f"'{effort}'. "
-                            f"Valid values: {', '.join(sorted(VALID_EFFORTS))}"
+                            f"Valid values: {_VALID_EFFORTS_STR}"
                         )
                         continue
                     model = agent_entry.model
@@ -160,24 +150,30 @@ def check(
                             f"is OpenAI-specific and may not be supported by '{model}'"
                         )
 
+                if builtin_names:
+                    ok.append(f"{len(builtin_names)} builtin tool(s): {', '.join(sorted(builtin_names))}")
+
                 # 7. Validate tools have docstrings and type hints
-                for name, tool_entry in tools_to_check.items():
-                    if not tool_entry.description:
-                        errors.append(f"Tool '{name}' missing docstring")
+                errors.extend(
+                    f"Tool '{name}' missing docstring"
+                    for name, tool_entry in tools_to_check.items()
+                    if not tool_entry.description
+                )
 
         except Exception as e:
             errors.append(f"Discovery error: {e}")
 
     # Print results
-    for msg in ok:
-        ui.success(msg)
-    for msg in warnings:
-        ui.warning(msg)
-    for msg in errors:
-        ui.error(msg)
+    with ui.batched():
+        for msg in ok:
+            ui.success(msg)
+        for msg in warnings:
+            ui.warning(msg)
+        for msg in errors:
+            ui.error(msg)
+        if not errors:
+            ui.plain()
+            ui.success("All checks passed.")
 
     if errors:
         raise typer.Exit(1)
-    else:
-        ui.plain()
-        ui.success("All checks passed.")
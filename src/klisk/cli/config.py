@@ -5,9 +5,6 @@ from __future__ import annotations
 from typing import Optional
 
 import typer
-import yaml
-
-from klisk.core.config import GlobalConfig
 
 
 def config(
@@ -21,12 +18,16 @@ def config(
       klisk config gcloud.project my-id     # set a value
       klisk config gcloud.region us-central1
     """
+    import yaml
+
+    from klisk.core.config import GLOBAL_CONFIG_KEYS, GlobalConfig, YamlDumper
+
     cfg = GlobalConfig.load()
 
     # No arguments — print current config
     if key is None:
         data = cfg.model_dump()
-        typer.echo(yaml.dump(data, default_flow_style=False, sort_keys=False).rstrip())
+        typer.echo(yaml.dump(data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).rstrip())
         return
 
     # Key without value — print that specific value
@@ -39,9 +40,15 @@ def config(
         return
 
     # Key + value — set it
-    if not _set_nested(cfg, key, value):
+    path = GLOBAL_CONFIG_KEYS.get(key)
+    if path is None:
         typer.echo(f"Unknown key: {key}", err=True)
         raise typer.Exit(1)
+    *parents, field = path
+    obj = cfg
+    for part in parents:
+        obj = getattr(obj, part)
+    setattr(obj, field, value)
 
     cfg.save()
     typer.echo(f"  {key} = {value}")
@@ -57,17 +64,3 @@ def _get_nested(data: dict, dotted_key: str):
         current = current[part]
     return current
 
-
-def _set_nested(model, dotted_key: str, value: str) -> bool:
-    """Set a value on a nested Pydantic model using a dotted key."""
-    parts = dotted_key.split(".")
-    obj = model
-    for part in parts[:-1]:
-        if not hasattr(obj, part):
-            return False
-        obj = getattr(obj, part)
-    field = parts[-1]
-    if not hasattr(obj, field):
-        return False
-    setattr(obj, field, value)
-    return True
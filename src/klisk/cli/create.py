@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import importlib.resources
 import platform
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 import typer
@@ -14,7 +17,10 @@ import typer
 from klisk.cli import ui
 from klisk.core.paths import get_project_path
 
+_VENV_PYTHON = Path("Scripts", "python.exe") if platform.system() == "Windows" else Path("bin", "python")
 
+
+@functools.lru_cache(maxsize=1)
 def _get_templates_dir() -> Path:
     """Locate the default template directory inside the installed package."""
     pkg_templates = Path(str(importlib.resources.files("klisk"))) / "templates" / "default"
@@ -24,43 +30,91 @@ def _get_templates_dir() -> Path:
     return Path(__file__).resolve().parent.parent.parent.parent / "templates" / "default"
 
 
+def _copy_template_file(src: str, dst: str, project_name: str) -> None:
+    """Copy a template file, filling in the project name in the config."""
+    if Path(src).name != "klisk.config.yaml":
+        shutil.copy2(src, dst)
+        return
+    with open(src) as f:
+        text = f.read()
+    with open(dst, "w") as f:
+        f.write(text.replace("{{project_name}}", project_name))
+    shutil.copystat(src, dst)
+
+
 def _venv_python(venv_dir: Path) -> Path:
     """Return the path to the Python executable inside a venv (cross-platform)."""
-    if platform.system() == "Windows":
-        return venv_dir / "Scripts" / "python.exe"
-    return venv_dir / "bin" / "python"
+    return venv_dir / _VENV_PYTHON
 
 
 def _setup_venv(project_dir: Path) -> None:
     """Create a virtual environment and install requirements.txt."""
     venv_dir = project_dir / ".venv"
     req_file = project_dir / "requirements.txt"
+    venv_py = _venv_python(venv_dir)
 
-    with ui.spinner("Setting up virtual environment"):
-        try:
-            subprocess.run(
-                [sys.executable, "-m", "venv", str(venv_dir)],
-                check=True, capture_output=True, text=True, timeout=60,
+    # uv builds the venv and resolves requirements far faster than pip does.
+    uv = shutil.which("uv")
+    if uv:
+        venv_cmd = [uv, "venv", "-q", "--seed", "--python", sys.executable, str(venv_dir)]
+    else:
+        venv_cmd = [sys.executable, "-m", "venv", str(venv_dir)]
+
+    with tempfile.TemporaryDirectory() as wheel_dir:
+        # Fetch the requirements with the host interpreter while the venv is
+        # being built. The venv runs the same Python, so the wheels fit it.
+        prefetch = None
+        if req_file.exists() and not uv:
+            prefetch = subprocess.Popen(
+                [sys.executable, "-m", "pip", "download", "-q", "-d", wheel_dir, "-r", str(req_file)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
             )
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
-            ui.warning(f"Could not create venv: {exc}")
-            ui.dim("You can create it manually: python -m venv .venv")
-            return
 
-    if not req_file.exists():
-        return
-
-    venv_py = _venv_python(venv_dir)
-    with ui.spinner("Installing dependencies"):
         try:
-            subprocess.run(
-                [str(venv_py), "-m", "pip", "install", "-q", "-r", str(req_file)],
-                check=True, capture_output=True, text=True, timeout=120,
-            )
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
-            ui.warning(f"Could not install dependencies: {exc}")
-            ui.dim("You can install them manually:")
-            ui.dim(f"  {venv_py} -m pip install -r requirements.txt")
+            with ui.spinner("Setting up virtual environment"):
+                try:
+                    subprocess.run(
+                        venv_cmd, check=True, capture_output=True, text=True, timeout=60,
+                    )
+                except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
+                    ui.warning(f"Could not create venv: {exc}")
+                    ui.dim("You can create it manually: python -m venv .venv")
+                    return
+
+            if not req_file.exists():
+                return
+
+            if uv:
+                install_cmd = [uv, "pip", "install", "-q", "--python", str(venv_py), "-r", str(req_file)]
+            else:
+                install_cmd = [str(venv_py), "-m", "pip", "install", "-q", "-r", str(req_file)]
+
+            with ui.spinner("Installing dependencies"):
+                # Waiting for the prefetch counts toward the install's time limit.
+                deadline = time.monotonic() + 120
+                try:
+                    installed = False
+                    if prefetch is not None and prefetch.wait(timeout=120) == 0:
+                        # Every wheel is local now, so skip the index; fall back
+                        # to a normal install if anything turns out missing.
+                        offline = subprocess.run(
+                            [*install_cmd, "--no-index", "--find-links", wheel_dir],
+                            capture_output=True, timeout=max(deadline - time.monotonic(), 0),
+                        )
+                        installed = offline.returncode == 0
+                    if not installed:
+                        subprocess.run(
+                            install_cmd, check=True, capture_output=True, text=True,
+                            timeout=max(deadline - time.monotonic(), 0),
+                        )
+                except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
+                    ui.warning(f"Could not install dependencies: {exc}")
+                    ui.dim("You can install them manually:")
+                    ui.dim(f"  {venv_py} -m pip install -r requirements.txt")
+        finally:
+            if prefetch is not None and prefetch.poll() is None:
+                prefetch.kill()
+                prefetch.wait()
 
     ui.plain()
 
@@ -75,13 +129,11 @@ def create(
         ui.error(f"Project '{name}' already exists at {target}")
         raise typer.Exit(1)
 
-    # Copy the template
-    shutil.copytree(_get_templates_dir(), target)
-
-    # Replace placeholder in config
-    config_path = target / "klisk.config.yaml"
-    config_text = config_path.read_text()
-    config_path.write_text(config_text.replace("{{project_name}}", name))
+    # Copy the template, replacing the placeholder in the config as it is written
+    shutil.copytree(
+        _get_templates_dir(), target,
+        copy_function=functools.partial(_copy_template_file, project_name=name),
+    )
 
     # Create .env from .env.example so the user has a file ready to edit
     env_example = target / ".env.example"
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 
 import typer
@@ -26,11 +29,19 @@ def delete(
         typer.echo(f"Error: '{project_path}' does not look like a Klisk project (no klisk.config.yaml).", err=True)
         raise typer.Exit(1)
 
+    if not force and not sys.stdin.isatty():
+        typer.echo("Error: refusing to delete without --force in non-interactive mode.", err=True)
+        raise typer.Exit(2)
+
     if not force:
         confirm = typer.confirm(f"Delete project '{project_path.name}' at {project_path}?")
         if not confirm:
             typer.echo("Aborted.")
             raise typer.Exit(0)
 
-    shutil.rmtree(project_path)
+    # rm walks large trees (the project's .venv) faster than shutil.rmtree.
+    if os.name == "posix":
+        subprocess.run(["rm", "-rf", "--", str(project_path)], check=True)
+    else:
+        shutil.rmtree(project_path)
     typer.echo(f"Deleted project '{project_path.name}'.")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
@@ -10,17 +11,31 @@ import typer
 from klisk.core.paths import resolve_project
 
 
+# Matches model="provider/name" assignments; scanned on raw bytes.
+_MODEL_RE = re.compile(rb'model\s*=\s*["\']([^"\']+/[^"\']+)["\']')
+
+# Directories that never hold project code: those in DOCKERIGNORE_TEMPLATE
+# plus build output.
+_SKIP_DIRS = frozenset({
+    ".venv", "__pycache__", ".git", "node_modules", ".mypy_cache", ".pytest_cache", "build", "dist",
+})
+
+
 def _needs_litellm(project_path: Path) -> bool:
     """Check if the project uses LiteLLM models (non-OpenAI providers)."""
-    for py_file in project_path.rglob("*.py"):
-        try:
-            content = py_file.read_text()
-        except Exception:
-            continue
-        for match in re.finditer(r'model\s*=\s*["\']([^"\']+/[^"\']+)["\']', content):
-            model_str = match.group(1)
-            if not model_str.startswith("openai/"):
-                return True
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        for filename in files:
+            if not filename.endswith(".py"):
+                continue
+            try:
+                with open(os.path.join(root, filename), "rb") as f:
+                    content = f.read()
+            except OSError:
+                continue
+            for match in _MODEL_RE.finditer(content):
+                if not match.group(1).startswith(b"openai/"):
+                    return True
     return False
 
 
@@ -80,40 +95,49 @@ def docker(
     req_path = project_path / "requirements.txt"
     klisk_dep = "klisk[litellm]" if use_litellm else "klisk"
 
+    existing_reqs = req_path.read_text() if req_path.exists() else None
     user_deps: list[str] = []
-    if req_path.exists():
-        for line in req_path.read_text().splitlines():
+    if existing_reqs is not None:
+        for line in existing_reqs.splitlines():
             stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            # Skip existing klisk entries (will be re-added with correct extras)
-            if stripped.lower().startswith("klisk"):
-                continue
-            # Skip any old wheel references
-            if stripped.startswith("./klisk-") and stripped.endswith(".whl"):
+            # Skip blanks, comments, existing klisk entries (re-added with the
+            # correct extras) and old wheel references
+            if (
+                not stripped
+                or stripped[0] == "#"
+                or stripped[:5].lower() == "klisk"
+                or (stripped.startswith("./klisk-") and stripped.endswith(".whl"))
+            ):
                 continue
             user_deps.append(stripped)
 
     req_lines = [klisk_dep] + user_deps
-    req_path.write_text("\n".join(req_lines) + "\n")
-
+    new_reqs = "\n".join(req_lines) + "\n"
     dep_info = klisk_dep
     if user_deps:
         dep_info += f" + {len(user_deps)} user dep(s)"
-    typer.echo(f"  Updated requirements.txt ({dep_info})")
+    # Only rewrite on change so Docker keeps the cached pip install layer.
+    if new_reqs != existing_reqs:
+        req_path.write_text(new_reqs)
+        typer.echo(f"  Updated requirements.txt ({dep_info})")
+    else:
+        typer.echo(f"  requirements.txt unchanged ({dep_info})")
 
     # --- Dockerfile ---
     dockerfile_path = project_path / "Dockerfile"
-    if dockerfile_path.exists():
+    if not dockerfile_path.exists():
+        dockerfile_path.write_text(DOCKERFILE_TEMPLATE)
+        typer.echo("  Created Dockerfile")
+    elif dockerfile_path.read_text() == DOCKERFILE_TEMPLATE:
+        # Leave it untouched so Docker keeps its layer cache.
+        typer.echo("  Dockerfile is up to date")
+    else:
         overwrite = typer.confirm("  Dockerfile already exists. Overwrite?", default=False)
         if not overwrite:
             typer.echo("  Skipped Dockerfile")
         else:
             dockerfile_path.write_text(DOCKERFILE_TEMPLATE)
             typer.echo("  Created Dockerfile")
-    else:
-        dockerfile_path.write_text(DOCKERFILE_TEMPLATE)
-        typer.echo("  Created Dockerfile")
 
     # --- .dockerignore ---
     dockerignore_path = project_path / ".dockerignore"
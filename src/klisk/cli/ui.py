@@ -72,6 +72,17 @@ def plain_err(msg: str) -> None:
     err_console.print(msg)
 
 
+@contextmanager
+def batched() -> Iterator[None]:
+    """Buffer console output and write it to the terminal in one go.
+
+    stdout is flushed before stderr, so errors printed after the other
+    messages still appear after them.
+    """
+    with err_console, console:
+        yield
+
+
 # ── Progress ─────────────────────────────────────────────────────────────────
 
 @contextmanager
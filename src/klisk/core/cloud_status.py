@@ -6,10 +6,14 @@ import re
 import subprocess
 
 
+_SLUG_BAD = re.compile(r"[^a-z0-9-]")
+_SLUG_DASHES = re.compile(r"-+")
+
+
 def _slugify(name: str) -> str:
     """Convert a project name to a valid Cloud Run service name."""
-    slug = re.sub(r"[^a-z0-9-]", "-", name.lower())
-    slug = re.sub(r"-+", "-", slug).strip("-")
+    slug = _SLUG_BAD.sub("-", name.lower())
+    slug = _SLUG_DASHES.sub("-", slug).strip("-")
     return slug or "klisk-agent"
 
 
@@ -9,6 +9,12 @@ from pydantic import BaseModel
 
 from klisk.core.paths import KLISK_HOME
 
+# libyaml's emitter when PyYAML was built with it, the pure-Python one otherwise.
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 
 # ---------------------------------------------------------------------------
 # Global config (~~/klisk/config.yaml)
@@ -26,10 +32,11 @@ class GlobalConfig(BaseModel):
     @classmethod
     def load(cls) -> GlobalConfig:
         path = KLISK_HOME / "config.yaml"
-        if not path.exists():
+        try:
+            with open(path) as f:
+                data = yaml.safe_load(f) or {}
+        except FileNotFoundError:
             return cls()
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
         return cls.model_validate(data)
 
     def save(self) -> None:
@@ -37,7 +44,25 @@ class GlobalConfig(BaseModel):
         path = KLISK_HOME / "config.yaml"
         data = self.model_dump()
         with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+
+
+def _leaf_fields(model_cls: type[BaseModel], prefix: str = "") -> dict[str, tuple[str, ...]]:
+    """Map every dotted leaf key of a model to its attribute path."""
+    keys: dict[str, tuple[str, ...]] = {}
+    for name, field in model_cls.model_fields.items():
+        dotted = f"{prefix}{name}"
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            for sub_key, sub_path in _leaf_fields(annotation, f"{dotted}.").items():
+                keys[sub_key] = (name, *sub_path)
+        else:
+            keys[dotted] = (name,)
+    return keys
+
+
+# Keys settable with `klisk config <key> <value>`, e.g. "gcloud.project".
+GLOBAL_CONFIG_KEYS = _leaf_fields(GlobalConfig)
 
 
 # ---------------------------------------------------------------------------
@@ -94,10 +119,11 @@ class ProjectConfig(BaseModel):
     @classmethod
     def load(cls, project_dir: str | Path) -> ProjectConfig:
         config_path = Path(project_dir) / "klisk.config.yaml"
-        if not config_path.exists():
+        try:
+            with open(config_path) as f:
+                data = yaml.safe_load(f) or {}
+        except FileNotFoundError:
             return cls()
-        with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
         return cls.model_validate(data)
 
     def save(self, project_dir: str | Path) -> None:
@@ -105,4 +131,4 @@ class ProjectConfig(BaseModel):
         config_path = Path(project_dir) / "klisk.config.yaml"
         data = self.model_dump()
         with open(config_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
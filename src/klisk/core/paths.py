@@ -56,7 +56,8 @@ def resolve_project(name_or_path: str) -> Path:
     """
     if "/" in name_or_path or name_or_path == ".":
         return Path(name_or_path).resolve()
-    candidate = get_project_path(name_or_path)
+    # A lookup does not need the projects directory to exist.
+    candidate = PROJECTS_DIR / name_or_path
     if candidate.exists():
         return candidate
     # Fallback: treat as a relative path
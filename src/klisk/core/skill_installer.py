@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 import os
 import shutil
+import time
 from pathlib import Path
 from urllib.error import URLError
 from urllib.request import Request, urlopen
@@ -21,6 +22,10 @@ SKILL_NAME = "klisk-guide"
 AGENTS_SKILL_DIR = Path.home() / ".agents" / "skills" / SKILL_NAME
 CLAUDE_SKILL_DIR = Path.home() / ".claude" / "skills" / SKILL_NAME
 
+# After a failed download, wait this long before trying the network again.
+RETRY_AFTER_SECONDS = 24 * 60 * 60
+FAILED_MARKER = ".skill-install-failed"
+
 
 def install_skill(klisk_home: Path) -> None:
     """Download the klisk-guide skill to ~/.agents/skills/klisk-guide/.
@@ -28,12 +33,20 @@ def install_skill(klisk_home: Path) -> None:
     Also creates a symlink at ~/.claude/skills/klisk-guide/ so Claude Code
     can discover it until it natively supports the .agents standard.
 
-    Skips if the skill is already installed. Silently fails on network errors.
+    Skips if the skill is already installed. Silently fails on network errors,
+    and does not retry for a day after a failure so offline runs stay fast.
     """
     if AGENTS_SKILL_DIR.exists():
         _ensure_claude_symlink()
         return
 
+    failed_marker = klisk_home / FAILED_MARKER
+    try:
+        if time.time() - failed_marker.stat().st_mtime < RETRY_AFTER_SECONDS:
+            return
+    except OSError:
+        pass
+
     try:
         _download_directory(GITHUB_API_URL, AGENTS_SKILL_DIR)
         _ensure_claude_symlink()
@@ -41,6 +54,12 @@ def install_skill(klisk_home: Path) -> None:
     except (URLError, OSError, json.JSONDecodeError, KeyError):
         if AGENTS_SKILL_DIR.exists():
             shutil.rmtree(AGENTS_SKILL_DIR, ignore_errors=True)
+        try:
+            failed_marker.touch()
+        except OSError:
+            pass
+    else:
+        failed_marker.unlink(missing_ok=True)
 
 
 def _ensure_claude_symlink() -> None:
@@ -19,6 +19,13 @@ from pathlib import Path
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from klisk.assistant.run import (
+    _TOOL_DETAIL_FIELDS,
+    _claude_cli_path,
+    _patch_sdk_message_parser,
+    _snapshot_sdk_env,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -103,21 +110,16 @@ async def install_assistant_sdk() -> dict:
 
 def _format_tool_detail(name: str, raw_json: str) -> str:
     """Extract a short detail string from tool input JSON."""
+    field = _TOOL_DETAIL_FIELDS.get(name)
+    if field is None:
+        return ""
     try:
         inp = json.loads(raw_json)
     except (json.JSONDecodeError, ValueError):
         return ""
-    detail = ""
-    if name in ("Read", "Write", "Edit"):
-        detail = inp.get("file_path", "")
-    elif name == "Bash":
-        detail = inp.get("command", "")
-        if len(detail) > 80:
-            detail = detail[:77] + "..."
-    elif name == "Grep":
-        detail = inp.get("pattern", "")
-    elif name == "Glob":
-        detail = inp.get("pattern", "")
+    detail = inp.get(field, "") if isinstance(inp, dict) else ""
+    if name == "Bash" and len(detail) > 80:
+        detail = detail[:77] + "..."
     return detail
 
 
@@ -167,7 +169,6 @@ async def handle_assistant_websocket(websocket: WebSocket, project_dir: Path) ->
         return
 
     # Patch SDK parser for new event types
-    from klisk.assistant.run import _patch_sdk_message_parser
     _patch_sdk_message_parser()
 
     from claude_agent_sdk import ClaudeAgentOptions, HookMatcher, ResultMessage, query
@@ -175,10 +176,11 @@ async def handle_assistant_websocket(websocket: WebSocket, project_dir: Path) ->
         PermissionResultAllow,
         PermissionResultDeny,
         StreamEvent,
+        SystemMessage,
     )
     from klisk.assistant.prompt import STUDIO_CONTEXT, SYSTEM_PROMPT
 
-    cli_path = shutil.which("claude")
+    cli_path = _claude_cli_path()
     session_id: str | None = None
 
     # Queue for interaction responses (permission + question answers)
@@ -324,6 +326,26 @@ async def handle_assistant_websocket(websocket: WebSocket, project_dir: Path) ->
         """Process user messages by running Claude Agent SDK queries."""
         nonlocal session_id
 
+        # Options are built once per connection; only `env` and `resume`
+        # change per query.
+        options = ClaudeAgentOptions(
+            model="opus",
+            system_prompt=SYSTEM_PROMPT + STUDIO_CONTEXT,
+            include_partial_messages=True,
+            allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep", "Skill", "AskUserQuestion"],
+            setting_sources=["user"],
+            permission_mode="acceptEdits",
+            hooks={
+                "PreToolUse": [
+                    HookMatcher(matcher="Bash", hooks=[_auto_approve_klisk]),
+                ],
+            },
+            can_use_tool=_can_use_tool,
+            cwd=str(project_dir),
+            max_turns=None,
+            cli_path=cli_path,
+        )
+
         while not shutdown.is_set():
             try:
                 msg = await asyncio.wait_for(message_queue.get(), timeout=1)
@@ -334,39 +356,10 @@ async def handle_assistant_websocket(websocket: WebSocket, project_dir: Path) ->
             if not user_text:
                 continue
 
-            # Clear CLAUDECODE to avoid nested session detection
-            os.environ.pop("CLAUDECODE", None)
-
-            sdk_env: dict[str, str] = {}
-            path = os.environ.get("PATH")
-            if path:
-                sdk_env["PATH"] = path
-            for key in ("ANTHROPIC_API_KEY", "CLAUDE_CODE_OAUTH_TOKEN"):
-                val = os.environ.get(key)
-                if val:
-                    sdk_env[key] = val
-
-            options = ClaudeAgentOptions(
-                model="opus",
-                system_prompt=SYSTEM_PROMPT + STUDIO_CONTEXT,
-                include_partial_messages=True,
-                allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep", "Skill", "AskUserQuestion"],
-                setting_sources=["user"],
-                permission_mode="acceptEdits",
-                hooks={
-                    "PreToolUse": [
-                        HookMatcher(matcher="Bash", hooks=[_auto_approve_klisk]),
-                    ],
-                },
-                can_use_tool=_can_use_tool,
-                cwd=str(project_dir),
-                max_turns=None,
-                env=sdk_env,
-                cli_path=cli_path,
-            )
-
-            if session_id:
-                options.resume = session_id
+            # Re-read every query: the Studio .env editor can change keys
+            # in os.environ while the connection is open.
+            options.env = _snapshot_sdk_env()
+            options.resume = session_id
 
             tool_input_buffer = ""
             current_tool = ""
@@ -428,15 +421,8 @@ async def handle_assistant_websocket(websocket: WebSocket, project_dir: Path) ->
 
                         message = item
 
-                        # Capture session ID from init message
-                        if (
-                            hasattr(message, "subtype")
-                            and message.subtype == "init"
-                            and hasattr(message, "data")
-                        ):
-                            session_id = message.data.get("session_id", session_id)
-
-                        elif isinstance(message, StreamEvent):
+                        # Stream events arrive once per delta, so check them first.
+                        if type(message) is StreamEvent:
                             event = message.event
                             event_type = event.get("type")
 
@@ -482,7 +468,11 @@ async def handle_assistant_websocket(websocket: WebSocket, project_dir: Path) ->
                                         break
                                     in_tool = False
 
-                        elif isinstance(message, ResultMessage):
+                        # Capture session ID from init message
+                        elif type(message) is SystemMessage and message.subtype == "init":
+                            session_id = message.data.get("session_id", session_id)
+
+                        elif type(message) is ResultMessage:
                             pass
                 finally:
                     sdk_task.cancel()
@@ -0,0 +1,43 @@
+"""Tests for the assistant's incremental Markdown rendering."""
+
+import io
+
+import pytest
+from rich.console import Console
+from rich.markdown import Markdown
+
+from klisk.assistant.run import _IncrementalMarkdown
+
+
+def _render(renderable) -> str:
+    console = Console(file=io.StringIO(), width=60, force_terminal=True, color_system="truecolor")
+    console.print(renderable)
+    return console.file.getvalue()
+
+
+def _stream(text: str, chunk_size: int) -> _IncrementalMarkdown:
+    view = _IncrementalMarkdown()
+    for i in range(0, len(text), chunk_size):
+        view.feed(text[i:i + chunk_size])
+    view.finish()
+    return view
+
+
+@pytest.mark.parametrize("text", [
+    # Loose ordered list
+    "1. a\n\n2. b\n\n3. c",
+    # List item with a continuation paragraph
+    "1. **Install**\n\n   Run `pip install klisk`\n\n2. **Use**\n\n   Done.",
+    # Indented code block
+    "Intro\n\n    x = 1\n    y = 2\n\nAfter",
+    "    x = 1\n\n    y = 2",
+    # Nested list and loose bullets
+    "1. one\n   - sub\n\n   - sub2\n\n2. two\n\ntext",
+    "- a\n\n  more a\n\n- b\n\nplain after",
+    # Blocks that do split
+    "# Title\n\nPara one\nline two\n\n- a\n- b\n\n> quote\n\n```py\nx\n\ny\n```\n\n---\n\nEnd.",
+    "a\n\n\n\nb\n\n",
+])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_incremental_matches_one_shot(text, chunk_size):
+    assert _render(_stream(text, chunk_size)) == _render(Markdown(text))
@@ -0,0 +1,100 @@
+"""Tests for the assistant's persistent SDK stream."""
+
+from pathlib import Path
+
+import pytest
+
+sdk = pytest.importorskip("claude_agent_sdk")
+
+from claude_agent_sdk import ResultMessage  # noqa: E402
+from claude_agent_sdk.types import StreamEvent, SystemMessage  # noqa: E402
+
+from klisk.assistant import run  # noqa: E402
+
+
+def _event(event):
+    return StreamEvent(uuid="u", session_id="sess-1", event=event)
+
+
+def _result():
+    return ResultMessage(
+        subtype="success", duration_ms=1, duration_api_ms=1, is_error=False,
+        num_turns=1, session_id="sess-1",
+    )
+
+
+async def _run_session(monkeypatch, inputs, *, turns_per_stream=None, partial_reply=False):
+    """Drive _run_loop with scripted input against a fake ``query()``."""
+    resumes: list[str | None] = []
+    delivered: list[str] = []
+    pending = iter([*inputs, "exit"])
+
+    async def _fake_read_input(console, prompt):
+        return next(pending)
+
+    async def _fake_query(*, prompt, options):
+        resumes.append(options.resume)
+        yield SystemMessage(subtype="init", data={"session_id": "sess-1"})
+        turns = 0
+        async for message in prompt:
+            delivered.append(message["message"]["content"])
+            yield _event({"type": "content_block_start", "content_block": {"type": "text"}})
+            yield _event({"type": "content_block_delta", "delta": {"type": "text_delta", "text": "ok"}})
+            if partial_reply:
+                return  # the subprocess dies mid-reply
+            yield _event({"type": "content_block_stop"})
+            yield _result()
+            turns += 1
+            if turns == turns_per_stream:
+                return  # the subprocess exits after this turn
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setattr(run, "_read_input", _fake_read_input)
+    monkeypatch.setattr(sdk, "query", _fake_query)
+    await run._run_loop(Path("."), "opus")
+    return resumes, delivered
+
+
+async def test_stream_is_reused_across_turns(monkeypatch):
+    resumes, delivered = await _run_session(monkeypatch, ["first", "second", "third"])
+    assert delivered == ["first", "second", "third"]
+    assert resumes == [None]
+
+
+async def test_stream_is_reopened_after_claude_exits(monkeypatch):
+    resumes, delivered = await _run_session(
+        monkeypatch, ["first", "second", "third"], turns_per_stream=1,
+    )
+    assert delivered == ["first", "second", "third"]
+    assert resumes == [None, "sess-1", "sess-1"]
+
+
+async def test_stream_ending_mid_reply_is_reported(monkeypatch, capsys):
+    resumes, delivered = await _run_session(monkeypatch, ["first", "second"], partial_reply=True)
+    assert delivered == ["first", "second"]
+    assert "ended before finishing its reply" in capsys.readouterr().out
+
+
+async def test_malformed_stream_events_are_skipped(monkeypatch, capsys):
+    async def _fake_query(*, prompt, options):
+        async for message in prompt:
+            yield _event({"type": "content_block_start", "content_block": {"type": "text"}})
+            yield _event({"type": "content_block_delta"})
+            yield _event({"type": "content_block_delta", "delta": {}})
+            yield _event({})
+            yield _event({"type": "content_block_delta", "delta": {"type": "text_delta", "text": "ok"}})
+            yield _event({"type": "content_block_stop"})
+            yield _result()
+
+    pending = iter(["first", "exit"])
+
+    async def _fake_read_input(console, prompt):
+        return next(pending)
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setattr(run, "_read_input", _fake_read_input)
+    monkeypatch.setattr(sdk, "query", _fake_query)
+    await run._run_loop(Path("."), "opus")
+    out = capsys.readouterr().out
+    assert "Error" not in out
+    assert "ok" in out
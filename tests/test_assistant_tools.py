@@ -0,0 +1,70 @@
+"""Tests for the assistant's streamed tool indicators."""
+
+import pytest
+
+from klisk.assistant.run import _ToolBlock, _ToolDetailScanner
+
+
+def _scan_chunks(name, chunks):
+    """Feed a scanner one growing buffer, returning the result after each chunk."""
+    scanner = _ToolDetailScanner(name)
+    buffer = bytearray()
+    results = []
+    for chunk in chunks:
+        buffer.extend(chunk.encode())
+        results.append(scanner.scan(buffer))
+    return results
+
+
+def _scan_bytewise(name, text):
+    data = text.encode()
+    scanner = _ToolDetailScanner(name)
+    for i in range(1, len(data) + 1):
+        detail = scanner.scan(data[:i])
+        if detail is not None:
+            return detail
+    return None
+
+
+@pytest.mark.parametrize(("text", "expected"), [
+    ('{"file_path": "/tmp/a.py"}', ": /tmp/a.py"),
+    # Escaped quotes and backslashes
+    ('{"file_path": "/tmp/say \\"hi\\".txt"}', ': /tmp/say "hi".txt'),
+    ('{"file_path": "C:\\\\dir\\\\x.py"}', ": C:\\dir\\x.py"),
+    # \uXXXX escapes
+    ('{"file_path": "/tmp/caf\\u00e9.md"}', ": /tmp/café.md"),
+    ('{"file_path": "/tmp/\\ud83d\\ude00"}', ": /tmp/\U0001f600"),
+    # Field name inside another value, escaped or not
+    ('{"content": "x \\"file_path\\": \\"/wrong\\"", "file_path": "/right"}', ": /right"),
+    ('{"content": "file_path", "file_path": "/right"}', ": /right"),
+    # Field name as a key of a nested object
+    ('{"opts": {"file_path": "/wrong"}, "file_path": "/right"}', ": /right"),
+    ('{"opts": ["file_path", {"file_path": "/wrong"}], "file_path": "/right"}', ": /right"),
+    # Non-string value of the field
+    ('{"file_path": 1, "other": "x"}', None),
+])
+def test_scanner_finds_top_level_field(text, expected):
+    assert _scan_chunks("Read", [text])[-1] == expected
+    assert _scan_bytewise("Read", text) == expected
+
+
+def test_scanner_waits_for_values_cut_off_mid_string():
+    results = _scan_chunks("Bash", ['{"comm', 'and": "echo \\', '"a', '\\u00', 'e9\\"', '"}'])
+    assert results == [None, None, None, None, None, ': echo "aé"']
+
+
+def test_scanner_shortens_long_commands():
+    detail = _scan_chunks("Bash", ['{"command": "' + "x" * 100 + '"}'])[-1]
+    assert detail == ": " + "x" * 57 + "..."
+
+
+def test_tool_block_shows_detail_before_stop():
+    lines = []
+    block = _ToolBlock("Write", lambda text, **kwargs: lines.append(text))
+    block.delta({"partial_json": '{"file_path": "/tmp/a'})
+    assert lines == []
+    block.delta({"partial_json": '.py", "content": "..."'})
+    assert lines == ["  > Write: /tmp/a.py"]
+    block.delta({"partial_json": "}"})
+    block.stop()
+    assert lines == ["  > Write: /tmp/a.py"]
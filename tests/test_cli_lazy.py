@@ -0,0 +1,38 @@
+"""Tests for the lazily loaded CLI commands."""
+
+import importlib
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from klisk.cli import _COMMANDS, app
+
+runner = CliRunner()
+
+
+def _eager_app() -> typer.Typer:
+    """Register every command up front, as the CLI originally did."""
+    eager = typer.Typer(name="klisk", add_completion=False)
+
+    @eager.callback(invoke_without_command=True)
+    def main(ctx: typer.Context) -> None:
+        """A framework for building AI agents programmatically."""
+
+    for name, (module_name, attr) in _COMMANDS.items():
+        eager.command(name)(getattr(importlib.import_module(module_name), attr))
+    return eager
+
+
+@pytest.mark.parametrize("name", list(_COMMANDS))
+def test_subcommand_help_matches_eager_registration(name):
+    lazy = runner.invoke(app, [name, "--help"], prog_name="klisk")
+    eager = runner.invoke(_eager_app(), [name, "--help"], prog_name="klisk")
+    assert lazy.exit_code == 0
+    assert lazy.output == eager.output
+    assert "--install-completion" not in lazy.output
+
+
+def test_subcommands_reject_completion_options():
+    result = runner.invoke(app, ["check", "--install-completion"], prog_name="klisk")
+    assert result.exit_code != 0
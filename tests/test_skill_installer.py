@@ -0,0 +1,54 @@
+"""Tests for the klisk-guide skill installer."""
+
+import os
+import time
+from urllib.error import URLError
+
+import pytest
+
+from klisk.core import skill_installer
+
+
+@pytest.fixture
+def downloads(tmp_path, monkeypatch):
+    monkeypatch.setattr(skill_installer, "AGENTS_SKILL_DIR", tmp_path / "agents" / "klisk-guide")
+    monkeypatch.setattr(skill_installer, "CLAUDE_SKILL_DIR", tmp_path / "claude" / "klisk-guide")
+    calls = []
+
+    def _fail(api_url, target_dir):
+        calls.append(api_url)
+        raise URLError("offline")
+
+    monkeypatch.setattr(skill_installer, "_download_directory", _fail)
+    return calls
+
+
+def test_failed_download_is_not_retried_within_a_day(tmp_path, downloads):
+    skill_installer.install_skill(tmp_path)
+    skill_installer.install_skill(tmp_path)
+    assert len(downloads) == 1
+    assert (tmp_path / skill_installer.FAILED_MARKER).exists()
+
+
+def test_failed_download_is_retried_after_a_day(tmp_path, downloads):
+    skill_installer.install_skill(tmp_path)
+    marker = tmp_path / skill_installer.FAILED_MARKER
+    stale = time.time() - skill_installer.RETRY_AFTER_SECONDS - 60
+    os.utime(marker, (stale, stale))
+
+    skill_installer.install_skill(tmp_path)
+    assert len(downloads) == 2
+
+
+def test_successful_download_clears_the_marker(tmp_path, monkeypatch, downloads):
+    skill_installer.install_skill(tmp_path)
+    marker = tmp_path / skill_installer.FAILED_MARKER
+    os.utime(marker, (0, 0))
+
+    def _ok(api_url, target_dir):
+        target_dir.mkdir(parents=True)
+
+    monkeypatch.setattr(skill_installer, "_download_directory", _ok)
+    skill_installer.install_skill(tmp_path)
+    assert not marker.exists()
+    assert skill_installer.CLAUDE_SKILL_DIR.is_symlink()